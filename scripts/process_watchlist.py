@@ -4,8 +4,11 @@ Usage: osascript extract_mail.scpt | python3 process_watchlist.py --out /path/to
 """
 import sys
 import argparse
+import functools
+import numpy as np
 import pandas as pd
 import io
+import json
 import re
 import csv
 from datetime import datetime
@@ -13,11 +16,106 @@ import os
 
 SEPARATOR = '---MSG---'
 
-def parse_message(msg_text):
-    """Parse message to extract recap date and tabular data."""
-    lines = [l.rstrip('\r') for l in msg_text.splitlines()]
+# Arrow-backed string columns store contiguous UTF-8 instead of per-element
+# Python objects; fall back to object dtype where pyarrow is unavailable
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = None
+
+# Strip thousands separators, leading '+', the 's' settled-price marker and
+# the '%' suffix in a single pass; 'unch'/'unchanged' means no change (0)
+_NUM_SCRUB = re.compile(r'[,+s%]')
+_UNCH = re.compile(r'^\s*unch\w*\s*$', re.IGNORECASE)
+
+# Column names a watchlist table can contain; header lines are matched
+# against this set instead of guessing from their first character
+KNOWN_HEADERS = frozenset({
+    'Symbol', 'Latest', 'Change', '%Change', 'Open', 'High', 'Low', 'Volume', 'Time',
+})
+
+# Month names for grouping, indexed by dt.month - 1; a tuple lookup beats
+# a strftime call per message
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+# Splits a message into lines, swallowing \r and blank lines in one pass
+_LINE_RE = re.compile(r'[\r\n]+')
+
+# Date part of "End-of-Day Recap - Price quotes for Tue, January 27, 2026"
+_RECAP_RE = re.compile(r'Price quotes for (.+?)(?:\n|$)')
+# $ and ^ prefixes on symbol names
+_SYM_TR = str.maketrans('', '', '$^')
+
+# Excel number format per column name (None / missing = General)
+_NUMBER_FORMATS = {
+    '%Change': '0.00"%"',
+    'Time': 'h:mm AM/PM',
+    'Latest': '0.00',
+    'Change': '0.00',
+    'Open': '0.00',
+    'High': '0.00',
+    'Low': '0.00',
+    'Volume': '0',
+}
+
+def _safe_float(s):
+    """Parse a scrubbed numeric string; unparseable values become NaN."""
+    try:
+        return float(s)
+    except ValueError:
+        return float('nan')
+
+
+def iter_messages(fileobj, sep=SEPARATOR):
+    """Yield one stripped message at a time from *fileobj*.
+
+    Streams the mail dump instead of reading it all into memory and
+    splitting: parsing starts on the first message and peak memory stays
+    bounded by a single message.
+    """
+    buf = []
+    for line in fileobj:
+        if line.strip() == sep:
+            msg = '\n'.join(buf).strip()
+            buf.clear()
+            if msg:
+                yield msg
+        elif sep in line:
+            # extract_mail.scpt joins bodies with the bare separator (no
+            # surrounding newlines), so it can arrive glued to the adjacent
+            # text: "...last line---MSG---End-of-Day Recap ...".  Split the
+            # line and flush a message at every separator.
+            pieces = line.rstrip('\n').split(sep)
+            for piece in pieces[:-1]:
+                buf.append(piece)
+                msg = '\n'.join(buf).strip()
+                buf.clear()
+                if msg:
+                    yield msg
+            buf.append(pieces[-1])
+        else:
+            buf.append(line.rstrip('\n'))
+    msg = '\n'.join(buf).strip()
+    if msg:
+        yield msg
+
+
+def _scan_message(msg_text):
+    """Scan one message and return (recap_date, header, rows).
+
+    This is the per-message half of parse_message: plain strings and lists
+    only, so results are cheap to pickle back from worker processes.
+    """
+    # C-level substring checks before any line splitting: inbox noise that
+    # is clearly not a recap is rejected without scanning it line by line
+    if 'End-of-Day Recap' not in msg_text or 'Price quotes for' not in msg_text:
+        return None, None, []
+
+    lines = [l for l in _LINE_RE.split(msg_text) if l]
     if not lines:
-        return None, pd.DataFrame()
+        return None, None, []
     
     # Extract the date from "End-of-Day Recap - Price quotes for Tue, January 27, 2026"
     recap_date = None
@@ -25,7 +123,7 @@ def parse_message(msg_text):
     for i, line in enumerate(lines):
         if 'End-of-Day Recap' in line and 'Price quotes for' in line:
             # Extract date part: "Tue, January 27, 2026"
-            match = re.search(r'Price quotes for (.+?)(?:\n|$)', line)
+            match = _RECAP_RE.search(line)
             if match:
                 recap_date = match.group(1).strip()
             data_start_idx = i + 1
@@ -40,22 +138,20 @@ def parse_message(msg_text):
     
     if header_idx is None:
         # No header found; try to parse as-is
-        return recap_date, pd.DataFrame()
+        return recap_date, None, []
     
-    # Collect header from consecutive lines after "Symbol"
+    # Collect header from consecutive lines after "Symbol" (the columns
+    # appear as separate lines); stop at the first line that is not a known,
+    # still-unseen column name - the first symbol, whatever it starts with
     header = ['Symbol']
-    data_start_line = header_idx + 1
-    
-    # Collect header columns (they appear as separate lines)
     i = header_idx + 1
-    while i < len(lines) and lines[i].strip() and not lines[i][0].isdigit() and not lines[i][0] in ('^', '$', 'N'):
+    while i < len(lines):
         col = lines[i].strip()
-        if col and col not in header:
-            header.append(col)
-        else:
+        if col not in KNOWN_HEADERS or col in header:
             break
+        header.append(col)
         i += 1
-    
+
     # Data rows start after header columns
     data_start_line = i
     
@@ -82,110 +178,303 @@ def parse_message(msg_text):
     # Add the last row if it's complete and not already added
     if current_row and len(current_row) == len(header) and (not rows or current_row != rows[-1]):
         rows.append(current_row)
-    
-    # Create DataFrame with header
+
+    return recap_date, header, rows
+
+
+def _build_dataframe(header, rows):
+    """Build the typed DataFrame from scanned header/rows (see _scan_message)."""
     if rows:
         try:
             print("Parsed rows:", file=sys.stderr)
             for r in rows:
                 print(r, file=sys.stderr)
-            df = pd.DataFrame(rows, columns=header)
-            # Clean symbol names: remove $ and ^ characters
-            if 'Symbol' in df.columns:
-                df['Symbol'] = df['Symbol'].str.replace(r'[\$\^]', '', regex=True)
-            # Convert numeric columns to float
-            numeric_cols = ['Latest', 'Change', 'Open', 'High', 'Low', 'Volume']
-            for col in numeric_cols:
-                if col in df.columns:
-                    print(f"Raw {col} values: ", df[col].tolist(), file=sys.stderr)
-                    raw = df[col].astype(str)
-                    unch_mask = raw.str.strip().str.match(r'^unch\w*$', case=False, na=False)
-                    df[col] = pd.to_numeric(
-                        raw
-                        .str.replace(',', '', regex=False)
-                        .str.replace('s', '', regex=False)
-                        .str.replace('+', '', regex=False)
-                        .str.replace(r'^\s*unch\w*\s*$', '0', regex=True, case=False),
-                        errors='coerce'
+            # Transpose once and convert each column before the DataFrame is
+            # built, instead of constructing an all-object frame and pushing
+            # the still-str values back through pandas string machinery
+            columns = dict(zip(header, zip(*rows)))
+            numeric_cols = ('Latest', 'Change', 'Open', 'High', 'Low', 'Volume', '%Change')
+            data = {}
+            for col, values in columns.items():
+                if col in numeric_cols:
+                    # %Change keeps its value as-is; it is formatted as a
+                    # percentage in Excel
+                    print(f"Raw {col} values: ", list(values), file=sys.stderr)
+                    # One consolidated float64 block per column; no
+                    # object-dtype intermediate and no per-column
+                    # re-assignment after the frame exists
+                    data[col] = np.array(
+                        [0.0 if _UNCH.match(x) else _safe_float(_NUM_SCRUB.sub('', x))
+                         for x in values],
+                        dtype=np.float64,
                     )
-                    df.loc[unch_mask, col] = 0.0
-                    print(f"Converted {col} values: ", df[col].tolist(), file=sys.stderr)
-            # Convert %Change: remove % prefix and convert to float (will be formatted as percentage in Excel)
-            if '%Change' in df.columns:
-                print("Raw %Change values: ", df['%Change'].tolist(), file=sys.stderr)
-                raw_pct = df['%Change'].astype(str)
-                unch_mask = raw_pct.str.strip().str.match(r'^unch\w*$', case=False, na=False)
-                df['%Change'] = pd.to_numeric(
-                    raw_pct
-                    .str.replace('%', '', regex=False)
-                    .str.replace(',', '', regex=False)
-                    .str.replace('+', '', regex=False)
-                    .str.replace(r'^\s*unch\w*\s*$', '0', regex=True, case=False),
-                    errors='coerce'
-                )
-                df.loc[unch_mask, '%Change'] = 0.0
-                print("Converted %Change values: ", df['%Change'].tolist(), file=sys.stderr)
+                    print(f"Converted {col} values: ", data[col].tolist(), file=sys.stderr)
+                else:
+                    if col == 'Symbol':
+                        # Clean symbol names: remove $ and ^ characters
+                        values = [s.translate(_SYM_TR) for s in values]
+                    if _STRING_DTYPE:
+                        data[col] = pd.array(values, dtype=_STRING_DTYPE)
+                    else:
+                        data[col] = values
+            df = pd.DataFrame(data)
         except Exception as e:
             print(f"Conversion error: {e}", file=sys.stderr)
             df = pd.DataFrame(rows)
     else:
         df = pd.DataFrame()
-    
-    return recap_date, df
 
-def _get_existing_dates(ws):
-    """Extract the set of date strings already present in a worksheet.
-    
+    return df
+
+
+def parse_message(msg_text):
+    """Parse message to extract recap date and tabular data."""
+    recap_date, header, rows = _scan_message(msg_text)
+    return recap_date, _build_dataframe(header, rows)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_recap_date(s):
+    """Parse a recap date like 'Tue, January 27, 2026'.
+
+    Memoized: batches routinely repeat the same date strings, and strptime
+    is pure-Python overhead per call.
+    """
+    return datetime.strptime(s, '%a, %B %d, %Y')
+
+
+def _get_existing_dates(grid):
+    """Extract the set of date strings already present in a sheet grid.
+
     Each date block has a 'Time' column (last in the block) whose data cells
     contain the date string (e.g. '02/03/26').  Walk the header row to find
     every 'Time' column, then read the first data cell beneath it.
     """
     existing = set()
-    for col in range(1, (ws.max_column or 0) + 1):
-        if ws.cell(row=1, column=col).value == 'Time':
-            val = ws.cell(row=2, column=col).value
+    if len(grid) < 2:
+        return existing
+    header, first_data = grid[0], grid[1]
+    for col, name in enumerate(header):
+        if name == 'Time' and col < len(first_data):
+            val = first_data[col]
             if val:
                 existing.add(str(val).strip())
     return existing
 
 
-def _next_free_col(ws):
-    """Return the first completely empty column (1-based) in *ws*."""
-    max_col = ws.max_column or 0
-    # walk backwards to skip trailing None-only columns openpyxl may report
-    for c in range(max_col, 0, -1):
-        for r in range(1, (ws.max_row or 0) + 1):
-            if ws.cell(row=r, column=c).value is not None:
-                return c + 3  # 2-column gap after last data column
-    return 1
-
-
-def _write_date_block(ws, current_col, df):
-    """Write a single date block (header + data rows) starting at *current_col*.
-    Returns the next available column after the block (with 2-col gap)."""
-    # Write header
-    for col_num, col_name in enumerate(df.columns, start=0):
-        cell = ws.cell(row=1, column=current_col + col_num)
-        cell.value = col_name
-
-    # Write data rows
-    for row_num, row in enumerate(df.values, start=2):
-        for col_num, val in enumerate(row):
-            cell = ws.cell(row=row_num, column=current_col + col_num)
-            cell.value = val
-
-            # Apply number formatting
-            col_name = df.columns[col_num]
-            if col_name == '%Change':
-                cell.number_format = '0.00"%"'
-            elif col_name == 'Time':
-                cell.number_format = 'h:mm AM/PM'
-            elif col_name in ['Latest', 'Change', 'Open', 'High', 'Low']:
-                cell.number_format = '0.00'
-            elif col_name == 'Volume':
-                cell.number_format = '0'
-
-    return current_col + len(df.columns) + 2
+def _date_key(df, dt):
+    """Short date key (e.g. '02/09/26') identifying a date block.
+
+    Matches what appears in the block's Time column, falling back to the
+    recap date itself.
+    """
+    time_col_vals = df['Time'].astype(str).tolist() if 'Time' in df.columns else []
+    return time_col_vals[0] if time_col_vals else dt.strftime('%m/%d/%y')
+
+
+def _load_month_cache(month_file, cache_file):
+    """Return the cached {sheet: {'grid': ..., 'dates': ...}} mapping for a
+    month file, or None if the cache is missing, unreadable, or stale.
+
+    The cache records the xlsx's mtime and size at save time; any mismatch
+    (e.g. the workbook was edited by hand) invalidates it, and the xlsx is
+    parsed as the source of truth instead.
+    """
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+        st = os.stat(month_file)
+        if cache['mtime'] != st.st_mtime or cache['size'] != st.st_size:
+            return None
+        return cache['sheets']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_month_cache(month_file, cache_file, grids, dates_by_sheet):
+    """Persist the written sheet grids and date keys next to the month file.
+
+    Failure to cache is never fatal: the next run just re-parses the xlsx.
+    The JSON goes to a temp file first and is renamed into place, so a
+    failed dump (e.g. a hand-edited workbook smuggled a datetime or other
+    non-JSON value into the grid) cannot leave a truncated cache behind.
+    """
+    tmp_file = cache_file + '.tmp'
+    try:
+        st = os.stat(month_file)
+        sheets = {
+            name: {
+                'grid': grids.get(name, []),
+                'dates': sorted(dates_by_sheet.get(name, ())),
+            }
+            for name in set(grids) | set(dates_by_sheet)
+        }
+        with open(tmp_file, 'w') as f:
+            json.dump({'mtime': st.st_mtime, 'size': st.st_size, 'sheets': sheets}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        print(f'Could not write {cache_file}: {e}', file=sys.stderr)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _sheet_sort_key(name):
+    """Sort key placing WeekN sheets in numeric order, anything else last."""
+    return int(name.replace('Week', '')) if name.startswith('Week') else 999
+
+
+def _read_sheet_grid(ws):
+    """Return the full contents of *ws* as a list of row-value lists.
+
+    Iterates whole rows at a time: random ws.cell() access materializes
+    cells one by one and is O(rows*cols) Python dispatch.
+    """
+    return [list(row) for row in ws.iter_rows(values_only=True)]
+
+
+def _register_styles(wb):
+    """Register one NamedStyle per distinct number format on an openpyxl
+    workbook and return a {column name: style} mapping.
+
+    Assigning a registered style is a single attribute write per cell,
+    instead of building a new number-format string every iteration.
+    """
+    from openpyxl.styles import NamedStyle
+
+    by_fmt = {}
+    for name, fmt in (('pct', '0.00"%"'), ('time', 'h:mm AM/PM'),
+                      ('num2', '0.00'), ('num0', '0')):
+        style = NamedStyle(name=name, number_format=fmt)
+        wb.add_named_style(style)
+        by_fmt[fmt] = style
+    return {col: by_fmt[fmt] for col, fmt in _NUMBER_FORMATS.items()}
+
+
+def _make_formats(wb):
+    """Create the shared cell formats once per xlsxwriter workbook."""
+    return {
+        'pct': wb.add_format({'num_format': '0.00"%"'}),
+        'time': wb.add_format({'num_format': 'h:mm AM/PM'}),
+        'num2': wb.add_format({'num_format': '0.00'}),
+        'num0': wb.add_format({'num_format': '0'}),
+    }
+
+
+# Which shared xlsxwriter format (see _make_formats) each column uses
+_FMT_KEYS = {
+    '%Change': 'pct',
+    'Time': 'time',
+    'Latest': 'num2',
+    'Change': 'num2',
+    'Open': 'num2',
+    'High': 'num2',
+    'Low': 'num2',
+    'Volume': 'num0',
+}
+
+
+def _fmt_for(col_name, fmts):
+    """Return the shared format for a column name, or None."""
+    key = _FMT_KEYS.get(col_name)
+    return fmts[key] if key else None
+
+
+def _write_cell(ws, row, col, val, fmt=None):
+    """Write one value with explicit type dispatch (0-based coordinates).
+
+    Returns the normalized value actually written, or None for blank cells.
+    """
+    if val is None:
+        return None
+    if isinstance(val, str):
+        ws.write_string(row, col, val, fmt)
+        return val
+    try:
+        num = float(val)
+    except (TypeError, ValueError):
+        ws.write(row, col, val, fmt)
+        return val
+    if num != num:
+        return None  # NaN -> leave the cell blank, as the openpyxl writer did
+    ws.write_number(row, col, num, fmt)
+    return num
+
+
+def _write_week_sheet(ws, grid, blocks, fmts):
+    """Write one week's sheet: previously saved cells (*grid*) plus every new
+    date block (*blocks*, a list of DataFrames) at increasing column offsets.
+
+    constant_memory workbooks flush each row as soon as the next one starts,
+    so iteration is strictly row-major across the grid and all blocks at once
+    rather than block-by-block.
+
+    Returns the merged grid (what the sheet now contains) so the caller can
+    cache it for the next run.
+    """
+    # Effective width of the existing grid, ignoring trailing empty columns
+    width = 0
+    for row in grid:
+        w = len(row)
+        while w and row[w - 1] is None:
+            w -= 1
+        if w > width:
+            width = w
+
+    # 0-based start column for each new block, keeping the 2-column gap
+    # between blocks that previous runs used.  Rows are materialized once
+    # per block with itertuples: indexing df.values casts the whole frame
+    # to a fresh object ndarray on every access
+    offsets = []
+    block_rows = []
+    block_cols = []
+    block_fmts = []
+    col = width + 2 if width else 0
+    for df in blocks:
+        offsets.append(col)
+        block_rows.append(list(df.itertuples(index=False, name=None)))
+        block_cols.append(list(df.columns))
+        block_fmts.append([_fmt_for(c, fmts) for c in df.columns])
+        col += len(df.columns) + 2
+
+    n_rows = len(grid)
+    for rows in block_rows:
+        if len(rows) + 1 > n_rows:
+            n_rows = len(rows) + 1
+
+    # Format lookups are hoisted out of the cell loops: one resolution per
+    # column instead of a name lookup and dispatch per cell
+    header = grid[0] if grid else []
+    header_fmts = [_fmt_for(name, fmts) for name in header]
+    total_cols = col if offsets else width
+    merged = []
+    for row_num in range(n_rows):
+        out_row = [None] * total_cols
+
+        # Re-emit the existing cells for this row, restoring each column's
+        # number format from its block header
+        if row_num < len(grid):
+            for col_num, val in enumerate(grid[row_num]):
+                if val is None:
+                    continue
+                if row_num == 0:
+                    out_row[col_num] = _write_cell(ws, row_num, col_num, val)
+                else:
+                    fmt = header_fmts[col_num] if col_num < len(header_fmts) else None
+                    out_row[col_num] = _write_cell(ws, row_num, col_num, val, fmt)
+
+        # Then this row's slice of every new date block
+        for offset, rows, cols, col_fmts in zip(offsets, block_rows, block_cols, block_fmts):
+            if row_num == 0:
+                for col_num, col_name in enumerate(cols):
+                    ws.write_string(0, offset + col_num, str(col_name))
+                    out_row[offset + col_num] = str(col_name)
+            elif row_num - 1 < len(rows):
+                for col_num, val in enumerate(rows[row_num - 1]):
+                    out_row[offset + col_num] = _write_cell(ws, row_num, offset + col_num, val, col_fmts[col_num])
+
+        merged.append(out_row)
+    return merged
 
 
 def write_to_excel_by_month(dfs_with_dates, out_path):
@@ -194,7 +483,8 @@ def write_to_excel_by_month(dfs_with_dates, out_path):
     Merges with existing xlsx files so data from previous runs is preserved and
     new dates are appended without duplicates.
     """
-    from openpyxl import Workbook, load_workbook
+    import xlsxwriter
+    from openpyxl import load_workbook
     
     # Get base directory from out_path
     base_dir = os.path.dirname(out_path)
@@ -208,8 +498,8 @@ def write_to_excel_by_month(dfs_with_dates, out_path):
             continue
         
         try:
-            dt = datetime.strptime(recap_date, '%a, %B %d, %Y')
-            month_name = dt.strftime('%B')  # e.g., 'January'
+            dt = _parse_recap_date(recap_date)
+            month_name = _MONTH_NAMES[dt.month - 1]  # e.g., 'January'
             day = dt.day
             # Calculate calendar week: days 1-7 = Week1, 8-14 = Week2, 15-21 = Week3, 22-28 = Week4, 29+ = Week5
             week_num = (day - 1) // 7 + 1
@@ -226,152 +516,182 @@ def write_to_excel_by_month(dfs_with_dates, out_path):
     # Create / update separate Excel file for each month
     for month_name in sorted(month_data.keys()):
         month_file = os.path.join(base_dir, f'{month_name.lower()}.xlsx')
-        
-        # Load existing workbook or create a new one
-        if os.path.exists(month_file):
-            wb = load_workbook(month_file)
-        else:
-            wb = Workbook()
-            wb.remove(wb.active)  # Remove default sheet
-        
-        week_nums = sorted(month_data[month_name].keys())
-        
-        for week_num in week_nums:
+        cache_file = os.path.splitext(month_file)[0] + '.cache.json'
+
+        # Fast path: if the cache from a previous run shows every incoming
+        # date already written, skip touching the workbook entirely
+        cached = _load_month_cache(month_file, cache_file) if os.path.exists(month_file) else None
+        if cached is not None:
+            pending = False
+            for week_num, entries in month_data[month_name].items():
+                known_keys = set(cached.get(f'Week{week_num}', {}).get('dates', ()))
+                for df, recap_date, dt in entries:
+                    if not df.empty and _date_key(df, dt) not in known_keys:
+                        pending = True
+                        break
+                if pending:
+                    break
+            if not pending:
+                print(f'{month_file} already has all incoming dates; skipping', file=sys.stderr)
+                continue
+
+        # Recover everything a previous run saved: xlsxwriter streams rows to
+        # disk and cannot reopen files, so each month is rewritten in full.
+        # With a valid cache the grids come straight from JSON and the xlsx
+        # (OOXML parse and all) is never opened for reading
+        grids = {}           # {sheet_name: list of row-value lists}
+        existing_by_sheet = {}  # {sheet_name: set of date keys}
+        if cached is not None:
+            for name, entry in cached.items():
+                grids[name] = entry.get('grid') or []
+                existing_by_sheet[name] = set(entry.get('dates') or ())
+        elif os.path.exists(month_file):
+            old_wb = load_workbook(month_file, read_only=True)
+            for ws in old_wb.worksheets:
+                grid = _read_sheet_grid(ws)
+                grids[ws.title] = grid
+                existing_by_sheet[ws.title] = _get_existing_dates(grid)
+            old_wb.close()
+
+        # Pick the new (non-duplicate) date blocks for each week sheet
+        new_blocks = {}  # {sheet_name: [df, ...]}
+        for week_num in sorted(month_data[month_name].keys()):
             sheet_name = f'Week{week_num}'
-            
-            # Get or create the sheet
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                existing_dates = _get_existing_dates(ws)
-                current_col = _next_free_col(ws)
-            else:
-                ws = wb.create_sheet(sheet_name)
-                existing_dates = set()
-                current_col = 1
-            
+            existing_dates = existing_by_sheet.setdefault(sheet_name, set())
+
             dfs_for_week = month_data[month_name][week_num]
             dfs_for_week_sorted = sorted(dfs_for_week, key=lambda x: x[2])
-            
+
             added = 0
             for df, recap_date, dt in dfs_for_week_sorted:
                 if df.empty:
                     continue
-                
-                # Derive the short date key that appears in the Time column
-                # (e.g. '02/09/26') so we can skip dates already written
-                time_col_vals = df['Time'].astype(str).tolist() if 'Time' in df.columns else []
-                date_key = time_col_vals[0] if time_col_vals else dt.strftime('%m/%d/%y')
-                
+
+                # Skip dates already written by a previous run
+                date_key = _date_key(df, dt)
                 if date_key in existing_dates:
                     continue  # already in the sheet from a previous run
-                
-                current_col = _write_date_block(ws, current_col, df)
+
+                new_blocks.setdefault(sheet_name, []).append(df)
                 existing_dates.add(date_key)
                 added += 1
-            
+
             if added:
                 print(f'  {sheet_name}: added {added} new date(s)', file=sys.stderr)
-        
-        # Sort sheets by week number
-        desired_order = sorted(wb.sheetnames, key=lambda s: int(s.replace('Week', '')) if s.startswith('Week') else 999)
-        for i, name in enumerate(desired_order):
-            wb.move_sheet(name, offset=i - wb.sheetnames.index(name))
-        
-        wb.save(month_file)
+
+        # Rewrite the month file as a row-ordered stream, sheets sorted by week
+        sheet_names = sorted(set(grids) | set(new_blocks), key=_sheet_sort_key)
+        wb = xlsxwriter.Workbook(month_file, {'constant_memory': True})
+        fmts = _make_formats(wb)
+        written_grids = {}
+        for sheet_name in sheet_names:
+            ws = wb.add_worksheet(sheet_name)
+            written_grids[sheet_name] = _write_week_sheet(
+                ws, grids.get(sheet_name, []), new_blocks.get(sheet_name, []), fmts)
+        wb.close()
+        _save_month_cache(month_file, cache_file, written_grids, existing_by_sheet)
         print(f'Saved {month_file}', file=sys.stderr)
 
 def write_to_excel(dfs_with_dates, out_path):
     # each dataframe in dfs is written to its own sheet named with the recap date
-    from openpyxl.styles import numbers
-    
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.cell import WriteOnlyCell
+
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    mode = 'a' if os.path.exists(out_path) else 'w'
-    try:
-        with pd.ExcelWriter(out_path, engine='openpyxl', mode=mode) as writer:
-            for df, sheet_name_base in dfs_with_dates:
-                # Use recap_date as sheet name, fallback to timestamp if not available
-                if sheet_name_base:
-                    sheet_name = sheet_name_base[:31]  # Excel sheet name max 31 chars
-                else:
-                    sheet_name = 'Watchlist_' + datetime.now().strftime('%Y%m%d_%H%M%S')
-                    sheet_name = sheet_name[:31]
-                
-                if df.empty:
-                    pd.DataFrame({'message': ['(empty)']}).to_excel(writer, sheet_name=sheet_name, index=False)
-                else:
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-                    # Apply formatting to columns
-                    ws = writer.sheets[sheet_name]
-                    for col_num, col_name in enumerate(df.columns, start=1):
-                        col_letter = ws.cell(row=1, column=col_num).column_letter
-                        
-                        if col_name == '%Change':
-                            # Percentage display without scaling
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = '0.00"%"'
-                        elif col_name == 'Time':
-                            # Time format
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = 'h:mm AM/PM'
-                        elif col_name in ['Latest', 'Change', 'Open', 'High', 'Low', 'Volume']:
-                            # Number format (2 decimal places for most, 0 for Volume)
-                            fmt = '0.00' if col_name != 'Volume' else '0'
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = fmt
-    except Exception as e:
-        # fallback: try writing single sheet if append mode fails
-        with pd.ExcelWriter(out_path, engine='openpyxl', mode='w') as writer:
-            for df, sheet_name_base in dfs_with_dates:
-                if sheet_name_base:
-                    sheet_name = sheet_name_base[:31]
-                else:
-                    sheet_name = 'Watchlist_' + datetime.now().strftime('%Y%m%d_%H%M%S')
-                    sheet_name = sheet_name[:31]
-                
-                if df.empty:
-                    pd.DataFrame({'message': ['(empty)']}).to_excel(writer, sheet_name=sheet_name, index=False)
-                else:
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-                    # Apply formatting to columns
-                    ws = writer.sheets[sheet_name]
-                    for col_num, col_name in enumerate(df.columns, start=1):
-                        col_letter = ws.cell(row=1, column=col_num).column_letter
-                        
-                        if col_name == '%Change':
-                            # Percentage display without scaling
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = '0.00"%"'
-                        elif col_name == 'Time':
-                            # Time format
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = 'h:mm AM/PM'
-                        elif col_name in ['Latest', 'Change', 'Open', 'High', 'Low', 'Volume']:
-                            # Number format (2 decimal places for most, 0 for Volume)
-                            fmt = '0.00' if col_name != 'Volume' else '0'
-                            for row_num in range(2, len(df) + 2):
-                                ws[f'{col_letter}{row_num}'].number_format = fmt
+
+    # A write_only workbook streams rows and cannot reopen an existing file,
+    # so carry over previously saved sheets as plain value grids and rewrite
+    # the whole file in one pass
+    old_sheets = {}
+    if os.path.exists(out_path):
+        try:
+            old_wb = load_workbook(out_path, read_only=True)
+            for ws in old_wb.worksheets:
+                old_sheets[ws.title] = _read_sheet_grid(ws)
+            old_wb.close()
+        except Exception as e:
+            print(f'Could not read existing {out_path}: {e}; rewriting from scratch', file=sys.stderr)
+            old_sheets = {}
+
+    new_sheets = {}
+    for df, sheet_name_base in dfs_with_dates:
+        # Use recap_date as sheet name, fallback to timestamp if not available
+        if sheet_name_base:
+            sheet_name = sheet_name_base[:31]  # Excel sheet name max 31 chars
+        else:
+            sheet_name = 'Watchlist_' + datetime.now().strftime('%Y%m%d_%H%M%S')
+            sheet_name = sheet_name[:31]
+        new_sheets[sheet_name] = df
+
+    wb = Workbook(write_only=True)
+    styles = _register_styles(wb)
+
+    # Carried-over sheets first (in saved order), skipping any being replaced
+    for name, grid in old_sheets.items():
+        if name in new_sheets:
+            continue
+        ws = wb.create_sheet(name)
+        header = grid[0] if grid else []
+        for row_num, row in enumerate(grid):
+            out_row = []
+            for col_num, val in enumerate(row):
+                cell = WriteOnlyCell(ws, value=val)
+                if row_num and col_num < len(header):
+                    style = styles.get(header[col_num])
+                    if style:
+                        cell.style = style
+                out_row.append(cell)
+            ws.append(out_row)
+
+    for sheet_name, df in new_sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        if df.empty:
+            ws.append(['message'])
+            ws.append(['(empty)'])
+            continue
+
+        ws.append([str(c) for c in df.columns])
+        col_styles = [styles.get(c) for c in df.columns]
+        for row in df.itertuples(index=False, name=None):
+            out_row = []
+            for val, style in zip(row, col_styles):
+                if val != val:  # NaN -> blank cell, as to_excel wrote it
+                    val = None
+                cell = WriteOnlyCell(ws, value=val)
+                if style:
+                    cell.style = style
+                out_row.append(cell)
+            ws.append(out_row)
+
+    wb.save(out_path)
 
 def main():
     parser = argparse.ArgumentParser(description='Process watchlist messages from stdin and write to Excel')
     parser.add_argument('--out', '-o', default=os.path.expanduser('~/Documents/watchlist_summary.xlsx'), help='Output Excel path')
     args = parser.parse_args()
 
-    data = sys.stdin.read()
-    if not data.strip():
-        print('No input received; no messages found.', file=sys.stderr)
-        return
-
-    parts = [p.strip() for p in data.split(SEPARATOR) if p.strip()]
-    if not parts:
-        print('No messages after splitting; exiting.', file=sys.stderr)
-        return
+    # Scan messages in parallel: _scan_message is pure and returns plain
+    # strings/lists, so only light tuples cross the process boundary; the
+    # DataFrames are built back in this process.  The messages are
+    # materialized once up front: ex.map consumes its iterable (and can
+    # fail) before workers finish, so the sequential fallback must see the
+    # same full list, not whatever is left of a half-drained stdin
+    from concurrent.futures import ProcessPoolExecutor
 
+    msgs = list(iter_messages(sys.stdin))
     dfs = []
-    for p in parts:
-        recap_date, df = parse_message(p)
-        dfs.append((df, recap_date))
+    try:
+        with ProcessPoolExecutor() as ex:
+            scanned = list(ex.map(_scan_message, msgs, chunksize=8))
+    except OSError as e:
+        print(f'Process pool unavailable ({e}); scanning sequentially', file=sys.stderr)
+        scanned = [_scan_message(p) for p in msgs]
+    for recap_date, header, rows in scanned:
+        dfs.append((_build_dataframe(header, rows), recap_date))
+
+    if not dfs:
+        print('No input received; no messages found.', file=sys.stderr)
+        return
 
     write_to_excel_by_month(dfs, args.out)
     print(f'Wrote {len(dfs)} message(s) to {args.out}', file=sys.stderr)